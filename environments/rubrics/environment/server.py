@@ -6,18 +6,30 @@ Manages SEC filing data access and state.
 import asyncio
 import logging
 import os
-import socket
+import random
+import re
+import time
 import traceback
+from collections import OrderedDict
+from contextlib import asynccontextmanager
+from contextvars import ContextVar
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
 from typing import Any, Awaitable, Callable, Dict, List, Optional, TypeVar
 from urllib.parse import urlparse
 
+import diskcache
 import httpx
+import redis.asyncio as aioredis
 import uvicorn
+from async_lru import alru_cache
 from edgar import Company, Filing, set_identity, get_filings as edgar_get_filings
 from edgar.financials import Financials
-from fastapi import FastAPI, HTTPException
-from pydantic import BaseModel
-from rubric import Rubric
+from fastapi import Depends, FastAPI, Header, HTTPException
+from fastapi.responses import ORJSONResponse
+from starlette.types import Receive, Scope, Send
+from pydantic import BaseModel, Field, TypeAdapter, ValidationError
+from rubric import CriterionReport, Rubric
 
 T = TypeVar("T")
 
@@ -26,6 +38,28 @@ T = TypeVar("T")
 logger = logging.getLogger(__name__)
 
 
+def _retry_after_seconds(response: httpx.Response) -> Optional[float]:
+    """Parse a Retry-After header (delta-seconds or HTTP-date), if present."""
+    value = response.headers.get("Retry-After")
+    if not value:
+        return None
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max(0.0, (retry_at - datetime.now(timezone.utc)).total_seconds())
+
+
+# Upstream statuses worth retrying: rate limiting and transient gateway/server errors
+RETRYABLE_STATUS_CODES = (429, 502, 503, 504)
+
+
 async def call_with_exponential_backoff(
     func: Callable[..., Awaitable[T]],
     *args: Any,
@@ -33,10 +67,18 @@ async def call_with_exponential_backoff(
     initial_delay: float = 1.0,
     max_delay: float = 60.0,
     exponential_base: float = 2.0,
+    max_transient_retries: Optional[int] = None,
     **kwargs: Any,
 ) -> T:
     """
-    Call an async function with exponential backoff on rate limit errors.
+    Call an async function with exponential backoff on rate limits and transient errors.
+
+    Retries HTTP 429/502/503/504 responses and connection-level failures (timeouts,
+    connect/read errors, dropped connections). Delays use decorrelated jitter so
+    concurrent callers don't retry in lockstep, and a Retry-After header from the
+    server takes precedence when present. 5xx responses and connection failures can be
+    given a smaller budget than 429s via max_transient_retries, so an upstream outage
+    surfaces as a prompt error instead of a long stall.
 
     Args:
         func: The async function to call
@@ -45,6 +87,7 @@ async def call_with_exponential_backoff(
         initial_delay: Initial delay in seconds (default: 1.0)
         max_delay: Maximum delay in seconds (default: 60.0)
         exponential_base: Base for exponential backoff (default: 2.0)
+        max_transient_retries: Retry cap for 5xx and connection errors (default: max_retries)
         **kwargs: Keyword arguments for the function
 
     Returns:
@@ -55,33 +98,42 @@ async def call_with_exponential_backoff(
     """
     last_exception: Optional[Exception] = None
     delay = initial_delay
+    if max_transient_retries is None:
+        max_transient_retries = max_retries
 
     for attempt in range(max_retries + 1):
         try:
             return await func(*args, **kwargs)
         except httpx.HTTPStatusError as e:
-            if e.response.status_code == 429:
-                last_exception = e
-                if attempt < max_retries:
-                    # Log the retry attempt
-                    logger.warning(
-                        "Rate limit hit (429), retrying in %s seconds... (attempt %s/%s)",
-                        delay,
-                        attempt + 1,
-                        max_retries,
-                    )
-                    await asyncio.sleep(delay)
-                    # Calculate next delay with exponential backoff
-                    delay = min(delay * exponential_base, max_delay)
-                else:
-                    # All retries exhausted
-                    raise
-            else:
-                # Not a rate limit error, raise immediately
+            if e.response.status_code not in RETRYABLE_STATUS_CODES:
+                # Not a transient error, raise immediately
                 raise
-        except Exception:
-            # Not an HTTP error, raise immediately
-            raise
+            last_exception = e
+            retry_after = _retry_after_seconds(e.response)
+            reason = f"HTTP {e.response.status_code}"
+            retries = max_retries if e.response.status_code == 429 else max_transient_retries
+        except (httpx.TimeoutException, httpx.NetworkError, httpx.RemoteProtocolError) as e:
+            last_exception = e
+            retry_after = None
+            reason = type(e).__name__
+            retries = max_transient_retries
+
+        if attempt >= retries:
+            # All retries exhausted
+            raise last_exception
+
+        # Decorrelated jitter, applied before the first wait as well
+        delay = min(max_delay, random.uniform(initial_delay, delay * exponential_base))
+        wait = min(retry_after, max_delay) if retry_after is not None else delay
+        # Log the retry attempt
+        logger.warning(
+            "%s, retrying in %.2f seconds... (attempt %s/%s)",
+            reason,
+            wait,
+            attempt + 1,
+            retries,
+        )
+        await asyncio.sleep(wait)
 
     # This should never be reached, but just in case
     if last_exception:
@@ -90,22 +142,94 @@ async def call_with_exponential_backoff(
 
 
 class _EnvState:
-    """In-memory environment state for tracking usage and agent answer."""
+    """Per-session environment state for tracking usage and agent answer.
+
+    Stored in Redis when REDIS_URL is set, so every uvicorn worker sees the same
+    session. Otherwise it is kept in-process, which is only correct with one worker.
+    Sessions expire SESSION_TTL seconds after their last write in both backends.
+    """
+
+    SESSION_TTL = 24 * 60 * 60
 
     def __init__(self) -> None:
-        self.search_count: int = 0
-        self.fetch_count: int = 0
-        self.submitted_answer: Optional[str] = None
+        self.redis: Optional[aioredis.Redis] = None
+        # sid -> (expires_at, session), ordered by last write so expired ones are in front
+        self._local: OrderedDict[str, tuple[float, Dict[str, Any]]] = OrderedDict()
+
+    @staticmethod
+    def _empty_session() -> Dict[str, Any]:
+        return {"search_count": 0, "fetch_count": 0, "answer": None}
+
+    def _expire_local(self) -> None:
+        now = time.monotonic()
+        while self._local:
+            sid, (expires_at, _) = next(iter(self._local.items()))
+            if expires_at > now:
+                break
+            del self._local[sid]
+
+    def _local_session(self, sid: str) -> Dict[str, Any]:
+        """Session dict for a write, refreshing its TTL."""
+        self._expire_local()
+        _, session = self._local.pop(sid, (0.0, None))
+        if session is None:
+            session = self._empty_session()
+        self._local[sid] = (time.monotonic() + self.SESSION_TTL, session)
+        return session
+
+    async def incr(self, sid: str, field: str) -> None:
+        if self.redis is None:
+            self._local_session(sid)[field] += 1
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hincrby(f"sess:{sid}", field, 1)
+            pipe.expire(f"sess:{sid}", self.SESSION_TTL)
+            await pipe.execute()
+
+    async def set_answer(self, sid: str, answer: str) -> None:
+        if self.redis is None:
+            self._local_session(sid)["answer"] = answer
+            return
+        async with self.redis.pipeline(transaction=True) as pipe:
+            pipe.hset(f"sess:{sid}", "answer", answer)
+            pipe.expire(f"sess:{sid}", self.SESSION_TTL)
+            await pipe.execute()
+
+    async def get(self, sid: str) -> Dict[str, Any]:
+        if self.redis is None:
+            self._expire_local()
+            entry = self._local.get(sid)
+            return dict(entry[1]) if entry is not None else self._empty_session()
+        data = await self.redis.hgetall(f"sess:{sid}")
+        return {
+            "search_count": int(data.get("search_count", 0)),
+            "fetch_count": int(data.get("fetch_count", 0)),
+            "answer": data.get("answer"),
+        }
 
-    def reset(self) -> None:
-        self.search_count = 0
-        self.fetch_count = 0
-        self.submitted_answer = None
+    async def reset(self, sid: str) -> None:
+        if self.redis is None:
+            self._local.pop(sid, None)
+            return
+        await self.redis.delete(f"sess:{sid}")
 
 
+REDIS_URL = os.getenv("REDIS_URL")
+
+# Without Redis each worker keeps its own sessions, so /evaluate on one worker never
+# sees an /answer posted to another. The uvicorn CLI reads both variables as well.
+_workers = int(os.getenv("UVICORN_WORKERS") or os.getenv("WEB_CONCURRENCY") or "1")
+if _workers > 1 and not REDIS_URL:
+    raise ValueError(f"REDIS_URL is required when running {_workers} uvicorn workers")
+
 state = _EnvState()
 
 
+def _session_id(x_session_id: Optional[str] = Header(None)) -> str:
+    """Session key sent by the MCP layer; single-session clients share "default"."""
+    return x_session_id or "default"
+
+
 class SearchCompanyRequest(BaseModel):
     query: str
 
@@ -128,6 +252,10 @@ class EvaluateRequest(BaseModel):
     rubric: list[dict[str, str | float]]
 
 
+# Dumps a whole rubric report in one pydantic-core call instead of one model_dump per item
+_REPORT_ADAPTER = TypeAdapter(list[CriterionReport])
+
+
 class RecentFilingsRequest(BaseModel):
     identifier: str | None = None  # ticker or CIK; if None, global recent
     form_type: str | None = None
@@ -140,7 +268,16 @@ class FilingByAccessionRequest(BaseModel):
     accession_number: str
 
 
-app = FastAPI(title="SEC EDGAR Environment API", version="0.1.0")
+class BatchOp(BaseModel):
+    op: str  # name of a read-only endpoint, e.g. "get_filings"
+    payload: dict[str, Any] = {}
+
+
+MAX_BATCH_OPS = 32
+
+
+class BatchRequest(BaseModel):
+    ops: list[BatchOp] = Field(..., max_length=MAX_BATCH_OPS)
 
 
 # Require SEC EDGAR identity via EDGAR_IDENTITY (format: "Your Name your.email@domain.com")
@@ -151,48 +288,516 @@ set_identity(_identity)
 logger.info(f"SEC EDGAR identity set to: {_identity}")
 
 
+# Shared client for direct requests to sec.gov, reused across requests
+sec_client = httpx.AsyncClient(
+    http2=True,
+    timeout=httpx.Timeout(30.0, connect=5.0),
+    limits=httpx.Limits(max_keepalive_connections=16, max_connections=32, keepalive_expiry=300),
+    headers={"User-Agent": _identity},
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Manage application lifecycle."""
+    if REDIS_URL:
+        state.redis = aioredis.Redis.from_url(REDIS_URL, decode_responses=True)
+    yield
+    await sec_client.aclose()
+    if state.redis is not None:
+        await state.redis.aclose()
+
+
+app = FastAPI(
+    title="SEC EDGAR Environment API",
+    version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
+)
+
+
 @app.get("/health")
 async def health() -> Dict[str, Any]:
+    # Fallback for servers started on `server:app`; `asgi` answers before reaching here
     return {"status": "healthy"}
 
 
+_HEALTH_BODY = b'{"status":"healthy"}'
+
+
+async def asgi(scope: Scope, receive: Receive, send: Send) -> None:
+    """ASGI entrypoint: answers GET /health directly, everything else goes to `app`.
+
+    Health checks run on every MCP startup and on each liveness probe, so they skip
+    FastAPI routing, validation and dependency resolution entirely.
+    """
+    if scope["type"] == "http" and scope["path"] == "/health" and scope["method"] == "GET":
+        await send(
+            {
+                "type": "http.response.start",
+                "status": 200,
+                "headers": [
+                    (b"content-type", b"application/json"),
+                    (b"content-length", str(len(_HEALTH_BODY)).encode()),
+                ],
+            }
+        )
+        await send({"type": "http.response.body", "body": _HEALTH_BODY})
+        return
+    await app(scope, receive, send)
+
+
 async def _is_port_open(port: int) -> bool:
-    sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-    sock.settimeout(0.15)
     try:
-        result = sock.connect_ex(("localhost", port))
-        sock.close()
-        return result == 0
-    except Exception:
+        _, writer = await asyncio.wait_for(asyncio.open_connection("localhost", port), timeout=0.15)
+    except (asyncio.TimeoutError, OSError):
         return False
+    writer.close()
+    await writer.wait_closed()
+    return True
 
 
 @app.post("/setup")
-async def setup() -> Dict[str, Any]:
-    state.reset()
+async def setup(sid: str = Depends(_session_id)) -> Dict[str, Any]:
+    await state.reset(sid)
     return {"ok": True}
 
 
+# SEC EDGAR lookups cached in-process. Company metadata and filing lists change on
+# an hours timescale; filing content is immutable once filed, so it has no TTL and
+# is also persisted to disk keyed by accession number to survive restarts.
+filing_cache = diskcache.Cache(os.getenv("EDGAR_CACHE_DIR", "/tmp/edgar_cache"))
+
+MAX_CONTENT_LENGTH = 50000
+
+# Accession numbers are 18 digits, written 0001104659-25-042659 or 000110465925042659
+_ACCESSION_RE = re.compile(r"(?<!\d)(\d{10})-?(\d{2})-?(\d{6})(?!\d)")
+
+
+def _truncate(content: str) -> str:
+    if len(content) > MAX_CONTENT_LENGTH:
+        return content[:MAX_CONTENT_LENGTH] + "\n\n...[truncated]"
+    return content
+
+
+# Cap on concurrent outbound SEC requests per process; SEC enforces 10 req/s per client
+EDGAR_SEM = asyncio.Semaphore(int(os.getenv("EDGAR_MAX_CONCURRENCY", "8")))
+
+
+# Set inside prefetch tasks: their SEC calls take a free EDGAR_SEM slot or none at all
+_SPECULATIVE: ContextVar[bool] = ContextVar("_SPECULATIVE", default=False)
+
+
+class _EdgarBusy(Exception):
+    """A speculative call found EDGAR_SEM saturated and was dropped instead of queueing."""
+
+
+async def _run_edgar(func: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+    """Run a blocking edgartools call in a worker thread, bounded by EDGAR_SEM."""
+    if _SPECULATIVE.get():
+        if EDGAR_SEM.locked():
+            raise _EdgarBusy(getattr(func, "__name__", repr(func)))
+        # acquire() returns without suspending when a slot is free, so nothing can run
+        # between the check above and taking the slot
+        await EDGAR_SEM.acquire()
+        try:
+            return await asyncio.to_thread(func, *args, **kwargs)
+        finally:
+            EDGAR_SEM.release()
+    async with EDGAR_SEM:
+        return await asyncio.to_thread(func, *args, **kwargs)
+
+
+# Retry budget for SEC calls made while serving a request. The MCP client times out
+# after 60s, so retries must give up well before that (the defaults allow 5 x 60s)
+SEC_MAX_RETRIES = 3
+SEC_MAX_DELAY = 10.0
+# 5xx and connection failures usually mean an SEC edge outage: retry once, then fail
+SEC_MAX_TRANSIENT_RETRIES = 1
+
+
+async def _sec_call(func: Callable[..., Awaitable[T]], *args: Any, **kwargs: Any) -> T:
+    """call_with_exponential_backoff with the bounded SEC retry budget."""
+    if _SPECULATIVE.get():
+        # A failed prefetch costs nothing; don't spend SEC requests retrying it
+        kwargs["max_retries"] = 0
+    kwargs.setdefault("max_retries", SEC_MAX_RETRIES)
+    kwargs.setdefault("max_delay", SEC_MAX_DELAY)
+    kwargs.setdefault("max_transient_retries", SEC_MAX_TRANSIENT_RETRIES)
+    return await call_with_exponential_backoff(func, *args, **kwargs)
+
+
+async def _fetch_sec_url(url: str) -> str:
+    """Fetch truncated text from a sec.gov URL with the shared client, bounded by EDGAR_SEM.
+
+    The body is streamed and reading stops once MAX_CONTENT_LENGTH is exceeded, so the
+    discarded tail of a large filing is never downloaded or decoded. Responses are kept
+    in filing_cache with their ETag/Last-Modified and revalidated with a conditional
+    GET, so an unchanged document costs a 304 with no body. diskcache does blocking
+    SQLite and file I/O, so cache reads and writes run in a worker thread.
+    """
+    cache_key = f"url:{url}"
+    entry = await asyncio.to_thread(filing_cache.get, cache_key)
+    headers = {}
+    if entry is not None:
+        etag, last_modified, _ = entry
+        if etag:
+            headers["If-None-Match"] = etag
+        if last_modified:
+            headers["If-Modified-Since"] = last_modified
+
+    chunks: list[str] = []
+    size = 0
+    async with EDGAR_SEM:
+        async with sec_client.stream("GET", url, headers=headers) as resp:
+            if resp.status_code == 304 and entry is not None:
+                return entry[2]
+            resp.raise_for_status()
+            etag = resp.headers.get("etag")
+            last_modified = resp.headers.get("last-modified")
+            async for chunk in resp.aiter_text():
+                chunks.append(chunk)
+                size += len(chunk)
+                if size > MAX_CONTENT_LENGTH:
+                    break
+
+    content = _truncate("".join(chunks))
+    if etag or last_modified:
+        await asyncio.to_thread(filing_cache.set, cache_key, (etag, last_modified, content))
+    return content
+
+
+# edgartools is synchronous and fetches lazily (even attribute access can hit the
+# network), so each lookup below is a plain function run via _run_edgar to keep
+# the event loop free while SEC responds.
+
+
+def _search_company(query: str) -> List[Dict[str, str]]:
+    company = Company(query)
+
+    # edgartools Company has tickers (plural) not ticker
+    ticker = company.tickers[0] if company.tickers else ""
+
+    return [
+        {
+            "ticker": ticker,
+            "name": company.name,
+            "cik": str(company.cik),
+            "message": f"Found company: {company.name} ({ticker})",
+        }
+    ]
+
+
+def _get_filings(ticker: str, form_type: Optional[str], limit: int) -> List[Dict[str, Any]]:
+    company = Company(ticker)
+
+    # Get filings (no limit parameter, apply limit after fetching)
+    if form_type:
+        filings = company.get_filings(form=form_type)
+    else:
+        filings = company.get_filings()
+
+    results = []
+    for filing in list(filings)[:limit]:
+        results.append(
+            {
+                "filing_date": filing.filing_date.strftime("%Y-%m-%d")
+                if filing.filing_date
+                else "",
+                "form_type": filing.form,
+                "description": filing.primary_doc_description or "",
+                "filing_url": filing.filing_url,
+                "accession_number": filing.accession_number,
+            }
+        )
+    return results
+
+
+def _find_filing(
+    identifier: str, accession_number: str, form: Optional[str] = None
+) -> tuple[Any, Any]:
+    """Locate a filing by ticker/CIK and accession number.
+
+    Returns the resolved Company and the matching filing (None if not found).
+    """
+    company = Company(identifier)
+    clean_req = accession_number.replace("-", "")
+    filings = company.get_filings(form=form) if form else company.get_filings()
+    for f in filings:
+        if getattr(f, "accession_number", "").replace("-", "") == clean_req:
+            return company, f
+    return company, None
+
+
+def _recent_filings(
+    identifier: Optional[str], form_type: Optional[str], limit: int
+) -> List[Dict[str, Any]]:
+    results: list[dict[str, Any]] = []
+
+    if identifier:
+        company = Company(identifier)
+        filings = company.get_filings(form=form_type) if form_type else company.get_filings()
+    else:
+        # Global feed via edgar.get_filings
+        filings = edgar_get_filings(form=form_type, count=limit)
+
+    for i, filing in enumerate(filings):
+        if i >= limit:
+            break
+        results.append(
+            {
+                "filing_date": filing.filing_date.strftime("%Y-%m-%d")
+                if filing.filing_date
+                else "",
+                "form_type": filing.form,
+                "company": getattr(filing, "company", None),
+                "cik": getattr(filing, "cik", None),
+                "file_number": getattr(filing, "file_number", None),
+                "acceptance_datetime": getattr(filing, "acceptance_datetime", None),
+                "period_of_report": getattr(filing, "period_of_report", None),
+                "filing_url": getattr(filing, "filing_url", getattr(filing, "url", None)),
+                "accession_number": filing.accession_number,
+                "description": getattr(filing, "primary_doc_description", ""),
+            }
+        )
+
+    return results
+
+
+def _filing_text(filing: Any) -> str:
+    """Extract filing text, falling back to HTML, across edgartools versions.
+
+    Truncates here, in the worker thread, so the full document is released before
+    the result is handed back to the event loop.
+    """
+    content = ""
+    try:
+        # Prefer full text submission
+        content = filing.text()
+    except Exception:
+        try:
+            content = filing.text  # property in some versions
+        except Exception:
+            content = ""
+
+    # Fallback to HTML
+    if not content:
+        try:
+            content = filing.html()
+        except Exception:
+            try:
+                content = filing.html  # property fallback
+            except Exception:
+                content = ""
+
+    return _truncate(content)
+
+
+# Structured accessors below (TenK/CurrentReport sections, items, segments,
+# financial statements) download and parse the filing when a property is first read,
+# so each extraction is done in full here and only plain data is returned.
+
+
+def _filing_hints(filing: Any) -> Dict[str, Any]:
+    """Minimal structured hints for a filing (8-K items, 10-K/10-Q financials flag)."""
+    filing_data: Dict[str, Any] = {}
+    obj = filing.obj()
+    if obj:
+        if filing.form == "8-K" and hasattr(obj, "items"):
+            filing_data["items"] = getattr(obj, "items", [])
+            filing_data["has_press_release"] = getattr(obj, "has_press_release", False)
+        elif filing.form in ["10-K", "10-Q"]:
+            filing_data["has_financials"] = True
+    return filing_data
+
+
+def _analyze_8k_items(filing: Any) -> Dict[str, Any]:
+    eightk = filing.obj()
+    return {
+        "has_structure": True,
+        "items": getattr(eightk, "items", []),
+        "has_press_release": getattr(eightk, "has_press_release", False),
+    }
+
+
+def _filing_sections(filing: Any, form_type: str) -> Dict[str, Any]:
+    filing_obj = filing.obj()
+    sections: Dict[str, Any] = {"has_structure": True}
+
+    # Extract sections based on form type
+    if form_type in ["10-K", "10-Q"]:
+        if hasattr(filing_obj, "business"):
+            sections["business"] = str(filing_obj.business)[:5000]
+        if hasattr(filing_obj, "risk_factors"):
+            sections["risk_factors"] = str(filing_obj.risk_factors)[:5000]
+        if hasattr(filing_obj, "mda"):
+            sections["mda"] = str(filing_obj.mda)[:5000]
+        if hasattr(filing_obj, "financials"):
+            sections["has_financials"] = True
+    return sections
+
+
+def _statement_data(statement: Any) -> Dict[str, Any]:
+    return {
+        "data": statement.to_dict(orient="index")
+        if hasattr(statement, "to_dict")
+        else str(statement)[:5000],
+        "columns": list(statement.columns) if hasattr(statement, "columns") else None,
+    }
+
+
+def _financial_data(filing: Any) -> Optional[Dict[str, Any]]:
+    """Extract income statement, balance sheet and cash flow, or None if unavailable."""
+    financials = Financials.extract(filing)
+    if not financials:
+        return None
+
+    financial_data: Dict[str, Any] = {}
+
+    # Extract income statement
+    try:
+        income = financials.income_statement()
+        if income is not None:
+            financial_data["income_statement"] = _statement_data(income)
+    except Exception as e:
+        logger.warning(f"Could not extract income statement: {e}")
+
+    # Extract balance sheet
+    try:
+        balance = financials.balance_sheet()
+        if balance is not None:
+            financial_data["balance_sheet"] = _statement_data(balance)
+    except Exception as e:
+        logger.warning(f"Could not extract balance sheet: {e}")
+
+    # Extract cash flow
+    try:
+        cashflow = financials.cashflow_statement()
+        if cashflow is not None:
+            financial_data["cash_flow"] = _statement_data(cashflow)
+    except Exception as e:
+        logger.warning(f"Could not extract cash flow: {e}")
+
+    return financial_data
+
+
+def _segment_data(filing: Any) -> Optional[str]:
+    filing_obj = filing.obj()
+
+    # Try to extract segment data
+    if hasattr(filing_obj, "segments"):
+        return str(filing_obj.segments)[:10000]
+    if hasattr(filing_obj, "notes") and hasattr(filing_obj.notes, "segments"):
+        return str(filing_obj.notes.segments)[:10000]
+    return None
+
+
+class _EmptyFilingContent(Exception):
+    """edgartools located the filing but returned no text or HTML for it."""
+
+
+def _load_filing_content(accession_no_dashes: str, cik: Optional[str]) -> str:
+    # Convert to accession format with dashes: 0001104659-25-042659
+    accession = (
+        f"{accession_no_dashes[:10]}-{accession_no_dashes[10:12]}-{accession_no_dashes[12:]}"
+    )
+
+    # Prefer locating via Company to satisfy Filing ctor requirements
+    filing = None
+    try:
+        if cik:
+            _, filing = _find_filing(cik, accession_no_dashes)
+    except Exception:
+        filing = None
+
+    # Fallback: try direct Filing by accession for versions that support it
+    if filing is None:
+        try:
+            filing = Filing(accession)
+        except TypeError:
+            filing = None
+
+    if filing is None:
+        raise HTTPException(status_code=404, detail=f"Filing not found for accession {accession}")
+
+    content = _filing_text(filing)
+    if not content:
+        # Raised rather than returned so alru_cache doesn't memoize a transient failure
+        raise _EmptyFilingContent(accession)
+    filing_cache.set(accession_no_dashes, content)
+    return content
+
+
+@alru_cache(maxsize=1024, ttl=3600)
+async def _search_company_cached(query: str) -> List[Dict[str, str]]:
+    return await _sec_call(_run_edgar, _search_company, query)
+
+
+@alru_cache(maxsize=1024, ttl=3600)
+async def _get_filings_cached(
+    ticker: str, form_type: Optional[str], limit: int
+) -> List[Dict[str, Any]]:
+    return await _sec_call(_run_edgar, _get_filings, ticker, form_type, limit)
+
+
+@alru_cache(maxsize=256)
+async def _get_filing_content_cached(accession_no_dashes: str, cik: Optional[str]) -> str:
+    """Return truncated filing text for an accession.
+
+    Raises _EmptyFilingContent when edgartools yields nothing; only non-empty content
+    is cached. The on-disk cache is checked first, outside EDGAR_SEM and the retry
+    loop, so filings already on disk never wait behind in-flight SEC calls.
+    """
+    cached = await asyncio.to_thread(filing_cache.get, accession_no_dashes)
+    if cached is not None:
+        return cached
+    return await _sec_call(_run_edgar, _load_filing_content, accession_no_dashes, cik)
+
+
+# Defaults of the get_filings MCP tool, so a prefetch lands on the key agents ask for
+_PREFETCH_FORM_TYPE: Optional[str] = None
+_PREFETCH_LIMIT = 10
+
+# Strong references to in-flight prefetch tasks so they aren't garbage collected
+_background_tasks: set[asyncio.Task[None]] = set()
+
+
+async def _warm_filings(ticker: str) -> None:
+    """Populate the get_filings cache for a ticker the agent is likely to ask about next.
+
+    Runs as a speculative call: it only takes an EDGAR_SEM slot that is free at that
+    moment and is dropped otherwise, so it never queues ahead of real calls.
+    """
+    token = _SPECULATIVE.set(True)
+    try:
+        await _get_filings_cached(ticker, _PREFETCH_FORM_TYPE, _PREFETCH_LIMIT)
+    except Exception as e:
+        logger.debug(f"Filings prefetch for {ticker} failed: {type(e).__name__}: {e}")
+    finally:
+        _SPECULATIVE.reset(token)
+
+
+def _schedule_warm_filings(ticker: str) -> None:
+    task = asyncio.create_task(_warm_filings(ticker))
+    _background_tasks.add(task)
+    task.add_done_callback(_background_tasks.discard)
+
+
 @app.post("/search_company")
-async def search_company(req: SearchCompanyRequest) -> List[Dict[str, str]]:
+async def search_company(
+    req: SearchCompanyRequest, sid: str = Depends(_session_id)
+) -> List[Dict[str, str]]:
     """Search for a company by ticker or name."""
     try:
         # Use edgartools to search for company
-        company = Company(req.query)
-
-        # edgartools Company has tickers (plural) not ticker
-        ticker = company.tickers[0] if company.tickers else ""
+        results = await _search_company_cached(req.query)
 
-        results = [
-            {
-                "ticker": ticker,
-                "name": company.name,
-                "cik": str(company.cik),
-                "message": f"Found company: {company.name} ({ticker})",
-            }
-        ]
+        # Agents almost always follow a search with get_filings; overlap that SEC
+        # round-trip with the agent's next turn
+        if results and results[0]["ticker"]:
+            _schedule_warm_filings(results[0]["ticker"])
 
-        state.search_count += 1
+        await state.incr(sid, "search_count")
         return results
 
     except Exception as e:
@@ -204,32 +809,19 @@ async def search_company(req: SearchCompanyRequest) -> List[Dict[str, str]]:
 
 
 @app.post("/get_filings")
-async def get_filings(req: GetFilingsRequest) -> List[Dict[str, Any]]:
+async def get_filings(
+    req: GetFilingsRequest, sid: str = Depends(_session_id)
+) -> List[Dict[str, Any]]:
     """Get recent filings for a company."""
     try:
-        company = Company(req.ticker)
-
-        # Get filings (no limit parameter, apply limit after fetching)
-        if req.form_type:
-            filings = company.get_filings(form=req.form_type)
-        else:
-            filings = company.get_filings()
-
-        results = []
-        for filing in list(filings)[: req.limit]:
-            results.append(
-                {
-                    "filing_date": filing.filing_date.strftime("%Y-%m-%d")
-                    if filing.filing_date
-                    else "",
-                    "form_type": filing.form,
-                    "description": filing.primary_doc_description or "",
-                    "filing_url": filing.filing_url,
-                    "accession_number": filing.accession_number,
-                }
-            )
+        try:
+            results = await _get_filings_cached(req.ticker, req.form_type, req.limit)
+        except _EdgarBusy:
+            # Joined an in-flight prefetch for this key that was dropped; fetch it now
+            _get_filings_cached.cache_invalidate(req.ticker, req.form_type, req.limit)
+            results = await _get_filings_cached(req.ticker, req.form_type, req.limit)
 
-        state.search_count += 1
+        await state.incr(sid, "search_count")
         return results
 
     except Exception as e:
@@ -239,7 +831,9 @@ async def get_filings(req: GetFilingsRequest) -> List[Dict[str, Any]]:
 
 
 @app.post("/get_filing_content")
-async def get_filing_content(req: GetFilingContentRequest) -> Dict[str, str]:
+async def get_filing_content(
+    req: GetFilingContentRequest, sid: str = Depends(_session_id)
+) -> Dict[str, str]:
     """Get the content of a specific filing."""
     try:
         # Parse the filing URL to extract accession number
@@ -247,12 +841,9 @@ async def get_filing_content(req: GetFilingContentRequest) -> Dict[str, str]:
         parsed = urlparse(req.filing_url)
         path_parts = parsed.path.split("/")
 
-        # Find the accession number without dashes
-        accession_no_dashes = None
-        for part in path_parts:
-            if len(part) >= 18 and part.isdigit():  # Accession numbers are 18 digits
-                accession_no_dashes = part
-                break
+        # Find the accession number (folder without dashes, or dashed in the filename)
+        match = _ACCESSION_RE.search(parsed.path)
+        accession_no_dashes = "".join(match.groups()) if match else None
 
         if not accession_no_dashes:
             raise HTTPException(
@@ -260,80 +851,28 @@ async def get_filing_content(req: GetFilingContentRequest) -> Dict[str, str]:
                 detail=f"Could not extract accession number from URL: {req.filing_url}",
             )
 
-        # Convert to accession format with dashes: 0001104659-25-042659
-        accession = (
-            f"{accession_no_dashes[:10]}-{accession_no_dashes[10:12]}-{accession_no_dashes[12:]}"
-        )
+        # Try to infer CIK from the URL path (segment after 'data')
+        cik = None
+        parts = [p for p in path_parts if p]
+        if "data" in parts:
+            idx = parts.index("data")
+            if idx + 1 < len(parts) and parts[idx + 1].isdigit():
+                cik = parts[idx + 1]
 
-        # Prefer locating via Company to satisfy Filing ctor requirements
-        filing = None
         try:
-            # Try to infer CIK from the URL path (segment after 'data')
-            cik = None
-            parts = [p for p in path_parts if p]
-            if "data" in parts:
-                idx = parts.index("data")
-                if idx + 1 < len(parts) and parts[idx + 1].isdigit():
-                    cik = parts[idx + 1]
-
-            if cik:
-                comp = Company(cik)
-                for f in comp.get_filings():
-                    if getattr(f, "accession_number", "").replace("-", "") == accession_no_dashes:
-                        filing = f
-                        break
-        except Exception:
-            filing = None
-
-        # Fallback: try direct Filing by accession for versions that support it
-        if filing is None:
-            try:
-                filing = Filing(accession)
-            except TypeError:
-                filing = None
-
-        if filing is None:
-            raise HTTPException(
-                status_code=404, detail=f"Filing not found for accession {accession}"
-            )
-
-        # Get the filing content with fallbacks
-        content = ""
-        try:
-            # Prefer full text submission
-            content = filing.text()
-        except Exception:
-            try:
-                content = filing.text  # property in some versions
-            except Exception:
-                content = ""
-
-        # Fallback to HTML
-        if not content:
-            try:
-                content = filing.html()
-            except Exception:
-                try:
-                    content = filing.html  # property fallback
-                except Exception:
-                    content = ""
+            content = await _get_filing_content_cached(accession_no_dashes, cik)
+        except _EmptyFilingContent:
+            content = ""
 
         # Final fallback: fetch the URL directly
         if not content:
             try:
-                async with httpx.AsyncClient(timeout=30.0) as client:
-                    resp = await client.get(req.filing_url, headers={"User-Agent": _identity})
-                    resp.raise_for_status()
-                    content = resp.text
+                # Second retry loop in this request, so keep it to a single retry
+                content = await _sec_call(_fetch_sec_url, req.filing_url, max_retries=1)
             except Exception:
                 content = ""
 
-        # Truncate if too long
-        max_length = 50000
-        if len(content) > max_length:
-            content = content[:max_length] + "\n\n...[truncated]"
-
-        state.fetch_count += 1
+        await state.incr(sid, "fetch_count")
         return {"content": content}
 
     except HTTPException:
@@ -355,38 +894,9 @@ async def get_recent_filings(req: RecentFilingsRequest) -> List[Dict[str, Any]]:
         limit: Max number of results
     """
     try:
-        results: list[dict[str, Any]] = []
-
-        if req.identifier:
-            company = Company(req.identifier)
-            filings = (
-                company.get_filings(form=req.form_type) if req.form_type else company.get_filings()
-            )
-        else:
-            # Global feed via edgar.get_filings
-            filings = edgar_get_filings(form=req.form_type, count=req.limit)
-
-        for i, filing in enumerate(filings):
-            if i >= req.limit:
-                break
-            results.append(
-                {
-                    "filing_date": filing.filing_date.strftime("%Y-%m-%d")
-                    if filing.filing_date
-                    else "",
-                    "form_type": filing.form,
-                    "company": getattr(filing, "company", None),
-                    "cik": getattr(filing, "cik", None),
-                    "file_number": getattr(filing, "file_number", None),
-                    "acceptance_datetime": getattr(filing, "acceptance_datetime", None),
-                    "period_of_report": getattr(filing, "period_of_report", None),
-                    "filing_url": getattr(filing, "filing_url", getattr(filing, "url", None)),
-                    "accession_number": filing.accession_number,
-                    "description": getattr(filing, "primary_doc_description", ""),
-                }
-            )
-
-        return results
+        return await _sec_call(
+            _run_edgar, _recent_filings, req.identifier, req.form_type, req.limit
+        )
     except Exception as e:
         logger.error(f"get_recent_filings failed: {type(e).__name__}: {e}")
         logger.error(traceback.format_exc())
@@ -399,14 +909,7 @@ async def get_recent_filings(req: RecentFilingsRequest) -> List[Dict[str, Any]]:
 async def get_filing_content_by_accession(req: FilingByAccessionRequest) -> Dict[str, Any]:
     """Get filing content and structured info via identifier + accession."""
     try:
-        company = Company(req.identifier)
-
-        filing = None
-        clean_req = req.accession_number.replace("-", "")
-        for f in company.get_filings():
-            if getattr(f, "accession_number", "").replace("-", "") == clean_req:
-                filing = f
-                break
+        _, filing = await _sec_call(_run_edgar, _find_filing, req.identifier, req.accession_number)
 
         if filing is None:
             raise HTTPException(
@@ -415,39 +918,12 @@ async def get_filing_content_by_accession(req: FilingByAccessionRequest) -> Dict
             )
 
         # Content
-        content = ""
-        try:
-            content = filing.text()
-        except Exception:
-            try:
-                content = filing.text
-            except Exception:
-                content = ""
-
-        if not content:
-            try:
-                content = filing.html()
-            except Exception:
-                try:
-                    content = filing.html
-                except Exception:
-                    content = ""
-
-        # Truncate
-        max_length = 50000
-        if len(content) > max_length:
-            content = content[:max_length] + "\n\n...[truncated]"
+        content = await _sec_call(_run_edgar, _filing_text, filing)
 
         # Optional: minimal structured hints
         filing_data: dict[str, Any] = {}
         try:
-            obj = filing.obj()
-            if obj:
-                if filing.form == "8-K" and hasattr(obj, "items"):
-                    filing_data["items"] = getattr(obj, "items", [])
-                    filing_data["has_press_release"] = getattr(obj, "has_press_release", False)
-                elif filing.form in ["10-K", "10-Q"]:
-                    filing_data["has_financials"] = True
+            filing_data = await _sec_call(_run_edgar, _filing_hints, filing)
         except Exception:
             pass
 
@@ -476,12 +952,9 @@ async def get_filing_content_by_accession(req: FilingByAccessionRequest) -> Dict
 async def analyze_8k(req: FilingByAccessionRequest) -> Dict[str, Any]:
     """Analyze an 8-K filing for specific events and items."""
     try:
-        company = Company(req.identifier)
-        filing = None
-        for f in company.get_filings(form="8-K"):
-            if f.accession_number.replace("-", "") == req.accession_number.replace("-", ""):
-                filing = f
-                break
+        _, filing = await _sec_call(
+            _run_edgar, _find_filing, req.identifier, req.accession_number, "8-K"
+        )
 
         if filing is None:
             raise HTTPException(
@@ -500,10 +973,7 @@ async def analyze_8k(req: FilingByAccessionRequest) -> Dict[str, Any]:
         }
 
         try:
-            eightk = filing.obj()
-            analysis["has_structure"] = True
-            analysis["items"] = getattr(eightk, "items", [])
-            analysis["has_press_release"] = getattr(eightk, "has_press_release", False)
+            analysis.update(await _sec_call(_run_edgar, _analyze_8k_items, filing))
         except Exception:
             pass
 
@@ -520,16 +990,8 @@ async def analyze_8k(req: FilingByAccessionRequest) -> Dict[str, Any]:
 async def get_filing_sections(req: FilingByAccessionRequest) -> Dict[str, Any]:
     """Get specific sections from a 10-K or 10-Q filing."""
     try:
-        company = Company(req.identifier)
-        filing = None
-        form_type = None
-
         # Try to find filing
-        for f in company.get_filings():
-            if f.accession_number.replace("-", "") == req.accession_number.replace("-", ""):
-                filing = f
-                form_type = f.form
-                break
+        _, filing = await _sec_call(_run_edgar, _find_filing, req.identifier, req.accession_number)
 
         if filing is None:
             raise HTTPException(
@@ -537,22 +999,12 @@ async def get_filing_sections(req: FilingByAccessionRequest) -> Dict[str, Any]:
                 detail=f"Filing {req.accession_number} not found for {req.identifier}",
             )
 
+        form_type = filing.form
+
         sections = {"form_type": form_type, "has_structure": False}
 
         try:
-            filing_obj = filing.obj()
-            sections["has_structure"] = True
-
-            # Extract sections based on form type
-            if form_type in ["10-K", "10-Q"]:
-                if hasattr(filing_obj, "business"):
-                    sections["business"] = str(filing_obj.business)[:5000]
-                if hasattr(filing_obj, "risk_factors"):
-                    sections["risk_factors"] = str(filing_obj.risk_factors)[:5000]
-                if hasattr(filing_obj, "mda"):
-                    sections["mda"] = str(filing_obj.mda)[:5000]
-                if hasattr(filing_obj, "financials"):
-                    sections["has_financials"] = True
+            sections.update(await _sec_call(_run_edgar, _filing_sections, filing, form_type))
         except Exception as e:
             logger.warning(f"Could not get structured sections: {e}")
 
@@ -571,14 +1023,10 @@ async def get_filing_sections(req: FilingByAccessionRequest) -> Dict[str, Any]:
 async def get_financials(req: FilingByAccessionRequest) -> Dict[str, Any]:
     """Extract financial statements and key metrics from a 10-K or 10-Q filing."""
     try:
-        company = Company(req.identifier)
-        filing = None
-
         # Try to find filing
-        for f in company.get_filings():
-            if f.accession_number.replace("-", "") == req.accession_number.replace("-", ""):
-                filing = f
-                break
+        company, filing = await _sec_call(
+            _run_edgar, _find_filing, req.identifier, req.accession_number
+        )
 
         if filing is None:
             raise HTTPException(
@@ -597,57 +1045,12 @@ async def get_financials(req: FilingByAccessionRequest) -> Dict[str, Any]:
         }
 
         try:
-            financials = Financials.extract(filing)
+            financial_data = await _sec_call(_run_edgar, _financial_data, filing)
 
-            if financials:
+            if financial_data is not None:
                 result["has_financials"] = True
                 result["cik"] = str(company.cik)
                 result["name"] = company.name
-                financial_data = {}
-
-                # Extract income statement
-                try:
-                    income = financials.income_statement()
-                    if income is not None:
-                        financial_data["income_statement"] = {
-                            "data": income.to_dict(orient="index")
-                            if hasattr(income, "to_dict")
-                            else str(income)[:5000],
-                            "columns": list(income.columns) if hasattr(income, "columns") else None,
-                        }
-                except Exception as e:
-                    logger.warning(f"Could not extract income statement: {e}")
-
-                # Extract balance sheet
-                try:
-                    balance = financials.balance_sheet()
-                    if balance is not None:
-                        financial_data["balance_sheet"] = {
-                            "data": balance.to_dict(orient="index")
-                            if hasattr(balance, "to_dict")
-                            else str(balance)[:5000],
-                            "columns": list(balance.columns)
-                            if hasattr(balance, "columns")
-                            else None,
-                        }
-                except Exception as e:
-                    logger.warning(f"Could not extract balance sheet: {e}")
-
-                # Extract cash flow
-                try:
-                    cashflow = financials.cashflow_statement()
-                    if cashflow is not None:
-                        financial_data["cash_flow"] = {
-                            "data": cashflow.to_dict(orient="index")
-                            if hasattr(cashflow, "to_dict")
-                            else str(cashflow)[:5000],
-                            "columns": list(cashflow.columns)
-                            if hasattr(cashflow, "columns")
-                            else None,
-                        }
-                except Exception as e:
-                    logger.warning(f"Could not extract cash flow: {e}")
-
                 result["financial_data"] = financial_data
         except Exception as e:
             logger.warning(f"Could not extract financials: {e}")
@@ -667,14 +1070,10 @@ async def get_financials(req: FilingByAccessionRequest) -> Dict[str, Any]:
 async def get_segment_data(req: FilingByAccessionRequest) -> Dict[str, Any]:
     """Extract segment-level financial data from a 10-K or 10-Q filing."""
     try:
-        company = Company(req.identifier)
-        filing = None
-
         # Try to find filing
-        for f in company.get_filings():
-            if f.accession_number.replace("-", "") == req.accession_number.replace("-", ""):
-                filing = f
-                break
+        company, filing = await _sec_call(
+            _run_edgar, _find_filing, req.identifier, req.accession_number
+        )
 
         if filing is None:
             raise HTTPException(
@@ -696,15 +1095,10 @@ async def get_segment_data(req: FilingByAccessionRequest) -> Dict[str, Any]:
         }
 
         try:
-            filing_obj = filing.obj()
-
-            # Try to extract segment data
-            if hasattr(filing_obj, "segments"):
+            segment_data = await _sec_call(_run_edgar, _segment_data, filing)
+            if segment_data is not None:
                 result["has_segment_data"] = True
-                result["segment_data"] = str(filing_obj.segments)[:10000]
-            elif hasattr(filing_obj, "notes") and hasattr(filing_obj.notes, "segments"):
-                result["has_segment_data"] = True
-                result["segment_data"] = str(filing_obj.notes.segments)[:10000]
+                result["segment_data"] = segment_data
         except Exception as e:
             logger.warning(f"Could not extract segment data: {e}")
 
@@ -719,19 +1113,67 @@ async def get_segment_data(req: FilingByAccessionRequest) -> Dict[str, Any]:
         )
 
 
+# Read-only endpoints available to /batch: (handler, request model, takes session id)
+_BATCH_OPS: Dict[str, tuple[Callable[..., Awaitable[Any]], type[BaseModel], bool]] = {
+    "search_company": (search_company, SearchCompanyRequest, True),
+    "get_filings": (get_filings, GetFilingsRequest, True),
+    "get_filing_content": (get_filing_content, GetFilingContentRequest, True),
+    "get_recent_filings": (get_recent_filings, RecentFilingsRequest, False),
+    "get_filing_content_by_accession": (
+        get_filing_content_by_accession,
+        FilingByAccessionRequest,
+        False,
+    ),
+    "analyze_8k": (analyze_8k, FilingByAccessionRequest, False),
+    "get_filing_sections": (get_filing_sections, FilingByAccessionRequest, False),
+    "get_financials": (get_financials, FilingByAccessionRequest, False),
+    "get_segment_data": (get_segment_data, FilingByAccessionRequest, False),
+}
+
+
+async def _run_batch_op(item: BatchOp, sid: str) -> Dict[str, Any]:
+    entry = _BATCH_OPS.get(item.op)
+    if entry is None:
+        return {"op": item.op, "status_code": 400, "error": f"Unknown batch op: {item.op}"}
+
+    handler, model, per_session = entry
+    try:
+        body = model(**item.payload)
+        result = await (handler(body, sid) if per_session else handler(body))
+    except ValidationError as e:
+        return {"op": item.op, "status_code": 422, "error": str(e)}
+    except HTTPException as e:
+        return {"op": item.op, "status_code": e.status_code, "error": e.detail}
+    return {"op": item.op, "status_code": 200, "result": result}
+
+
+@app.post("/batch")
+async def batch(req: BatchRequest, sid: str = Depends(_session_id)) -> List[Dict[str, Any]]:
+    """Run several read-only operations concurrently in one round-trip.
+
+    Results are returned in request order; a failing op reports its own status code
+    and error without affecting the others.
+    """
+    return await asyncio.gather(*[_run_batch_op(item, sid) for item in req.ops])
+
+
 @app.post("/answer")
-async def answer(req: AnswerRequest) -> Dict[str, Any]:
-    state.submitted_answer = req.final_answer
+async def answer(req: AnswerRequest, sid: str = Depends(_session_id)) -> Dict[str, Any]:
+    await state.set_answer(sid, req.final_answer)
     return {"ok": True, "message": "Answer submitted"}
 
 
 @app.post("/evaluate")
-async def evaluate(req: EvaluateRequest) -> Dict[str, Any]:
-    submitted = state.submitted_answer
+async def evaluate(req: EvaluateRequest, sid: str = Depends(_session_id)) -> Dict[str, Any]:
+    session = await state.get(sid)
+    submitted = session["answer"]
     if submitted is None:
         return {
             "reward": 0.0,
-            "content": f"No answer submitted. Searches: {state.search_count}, Fetches: {state.fetch_count}",
+            "content": (
+                f"No answer submitted. Searches: {session['search_count']}, "
+                f"Fetches: {session['fetch_count']}"
+            ),
             "done": False,
         }
 
@@ -742,7 +1184,9 @@ async def evaluate(req: EvaluateRequest) -> Dict[str, Any]:
         rubric = Rubric.from_dict(req.rubric)
         evaluation = await rubric.grade(submitted)
         reward = evaluation.score
-        info = {"report": [r.model_dump() for r in evaluation.report] if evaluation.report else []}
+        info = {
+            "report": _REPORT_ADAPTER.dump_python(evaluation.report) if evaluation.report else []
+        }
 
         logger.info(f"Rubric evaluation completed. Score: {reward}")
         logger.info(f"Evaluation report: {info}")
@@ -762,4 +1206,16 @@ if __name__ == "__main__":
         level=logging.INFO, format="%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
 
-    uvicorn.run(app, host="0.0.0.0", port=8000)
+    # uvloop + httptools keep the event loop and HTTP parsing in C; access logging is
+    # disabled because it is a measurable per-request cost on the hot endpoints.
+    # Multiple workers are only safe when session state lives in Redis.
+    default_workers = (os.cpu_count() or 1) if REDIS_URL else 1
+    uvicorn.run(
+        "server:asgi",
+        host="0.0.0.0",
+        port=8000,
+        loop="uvloop",
+        http="httptools",
+        workers=int(os.getenv("UVICORN_WORKERS", default_workers)),
+        access_log=False,
+    )
@@ -5,6 +5,7 @@ import httpx
 import os
 import sys
 import logging
+import uuid
 
 from hud.tools.types import EvaluationResult
 from hud.server import MCPServer
@@ -23,11 +24,15 @@ mcp = MCPServer(name="sec-rubrics")
 # Environment server URL (backend)
 ENV_SERVER_URL = os.getenv("ENV_SERVER_URL", "http://localhost:8000")
 
-# Shared HTTP client to talk to the environment
+# Identifies this MCP session to the environment so its state is kept separate
+SESSION_ID = os.getenv("SESSION_ID") or uuid.uuid4().hex
+
+# Shared HTTP client to talk to the environment (pooled so parallel tool calls don't queue)
 http_client = httpx.AsyncClient(
     base_url=ENV_SERVER_URL,
-    timeout=60.0,  # Increased timeout for SEC EDGAR operations
-    headers={"User-Agent": "HUD-SEC-Rubrics-Controller/1.0"},
+    timeout=httpx.Timeout(60.0, connect=5.0),  # Increased timeout for SEC EDGAR operations
+    limits=httpx.Limits(max_keepalive_connections=64, max_connections=128, keepalive_expiry=300),
+    headers={"User-Agent": "HUD-SEC-Rubrics-Controller/1.0", "X-Session-Id": SESSION_ID},
 )
 
 
@@ -148,6 +153,21 @@ async def get_segment_data(identifier: str, accession_number: str) -> Any:
     return resp.json()
 
 
+@mcp.tool()
+async def batch(ops: list[dict[str, Any]]) -> Any:
+    """Run several read-only tools concurrently in a single call.
+
+    Each op is {"op": <tool name>, "payload": {<tool arguments>}}, e.g.
+    {"op": "get_filings", "payload": {"ticker": "TSLA", "form_type": "10-K"}}.
+    Supported ops: search_company, get_filings, get_filing_content, get_recent_filings,
+    get_filing_content_by_accession, analyze_8k, get_filing_sections, get_financials,
+    get_segment_data. At most 32 ops per call; split larger lookups across calls.
+    Returns one {"op", "status_code", "result" | "error"} per op, in order.
+    """
+    resp = await http_client.post("/batch", json={"ops": ops})
+    return resp.json()
+
+
 @mcp.tool()
 async def answer(final_answer: str) -> str:
     await http_client.post("/answer", json={"final_answer": final_answer})